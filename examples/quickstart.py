@@ -5,12 +5,14 @@ Run this file directly to verify your installation and explore the API:
 
     python examples/quickstart.py
 
-Each demo function is self-contained and prints clearly labelled output.
+Each demo function is self-contained and prints clearly labelled output. The demos
+share one crop database and advisor via ``get_crop_database``/``get_crop_advisor``,
+so the catalogue is built once for the whole run.
 """
 
 from __future__ import annotations
 
-from aumai_farmbrain.core import CropAdvisor, CropDatabase, SoilAnalyzer
+from aumai_farmbrain.core import SoilAnalyzer, get_crop_advisor, get_crop_database
 from aumai_farmbrain.models import SoilProfile, WeatherData
 
 
@@ -25,7 +27,7 @@ def demo_crop_database() -> None:
     print("DEMO 1: Crop Database")
     print("=" * 60)
 
-    db = CropDatabase()
+    db = get_crop_database()
     all_crops = db.all_crops()
     print(f"Total crops in database: {len(all_crops)}")
 
@@ -47,7 +49,7 @@ def demo_crop_database() -> None:
     # Crops for black soil
     black_soil_crops = db.by_soil_type("black")
     print(f"\nCrops compatible with black soil: {len(black_soil_crops)}")
-    low_water = [c for c in black_soil_crops if c.water_requirement == "low"]
+    low_water = db.select(soil_type="black", water_requirement="low")
     print(f"  Of which low-water-requirement: {len(low_water)}")
     for crop in low_water:
         print(f"    {crop.name} ({crop.season})")
@@ -75,15 +77,15 @@ def demo_soil_analysis() -> None:
         soil_type="black",
     )
 
-    analyzer = SoilAnalyzer()
-    recommendations = analyzer.analyze(soil)
+    analyzer = SoilAnalyzer(get_crop_database())
+    # Leave out the trailing disclaimer for cleaner demo output
+    recommendations = analyzer.analyze(soil, include_disclaimer=False)
 
     print(f"\nSoil profile: pH={soil.ph}, N={soil.nitrogen_ppm} ppm, "
           f"P={soil.phosphorus_ppm} ppm, K={soil.potassium_ppm} ppm, "
           f"OC={soil.organic_carbon_pct}%")
     print("\nSoil analysis recommendations:")
-    # Skip the last element (disclaimer) for cleaner demo output
-    for rec in recommendations[:-1]:
+    for rec in recommendations:
         print(f"  - {rec}")
 
     # Find compatible crops for this soil
@@ -105,8 +107,8 @@ def demo_crop_advisory_wheat() -> None:
     print("DEMO 3: Wheat Advisory — Alluvial Soil, UP")
     print("=" * 60)
 
-    db = CropDatabase()
-    advisor = CropAdvisor()
+    db = get_crop_database()
+    advisor = get_crop_advisor()
 
     crop = db.by_name("wheat")
     if crop is None:
@@ -161,8 +163,8 @@ def demo_advisory_with_weather() -> None:
     print("DEMO 4: Rice Advisory with Weather — Bihar, Peak Monsoon")
     print("=" * 60)
 
-    db = CropDatabase()
-    advisor = CropAdvisor()
+    db = get_crop_database()
+    advisor = get_crop_advisor()
 
     crop = db.by_name("rice")
     if crop is None:
@@ -218,8 +220,8 @@ def demo_drought_tolerant_crops() -> None:
     print("DEMO 5: Drought-Tolerant Crop Screening — Rajasthan Sandy Loam")
     print("=" * 60)
 
-    db = CropDatabase()
-    analyzer = SoilAnalyzer()
+    db = get_crop_database()
+    analyzer = SoilAnalyzer(get_crop_database())
 
     # Sandy loam in eastern Rajasthan — alkaline, low organic carbon, low moisture
     soil = SoilProfile(
@@ -233,9 +235,13 @@ def demo_drought_tolerant_crops() -> None:
 
     # Find crops compatible with this alkaline sandy loam
     compatible = analyzer.suitable_crops(soil)
+    compatible_names = {c.name for c in compatible}
 
-    # Filter to low water requirement only (drought tolerant)
-    drought_tolerant = [c for c in compatible if c.water_requirement == "low"]
+    # Low water requirement crops (drought tolerant), already sorted by growth days
+    drought_tolerant = [
+        c for c in db.by_soil_and_water(soil.soil_type, "low")
+        if c.name in compatible_names
+    ]
 
     print(f"\nSoil: {soil.soil_type}, pH {soil.ph} (alkaline)")
     print(f"Total compatible crops: {len(compatible)}")
@@ -243,15 +249,15 @@ def demo_drought_tolerant_crops() -> None:
 
     print(f"\n{'Crop':<32} {'Season':<10} {'Days':>6}")
     print("-" * 52)
-    for crop in sorted(drought_tolerant, key=lambda c: c.growth_days):
+    for crop in drought_tolerant:
         print(f"{crop.name:<32} {crop.season:<10} {crop.growth_days:>6}")
 
     # Quick advisory for the fastest-maturing drought-tolerant crop
     if drought_tolerant:
-        fastest = min(drought_tolerant, key=lambda c: c.growth_days)
+        fastest = drought_tolerant[0]
         print(f"\nRecommended quick-maturing option: {fastest.name} "
               f"({fastest.growth_days} days, {fastest.season})")
-        advisor = CropAdvisor()
+        advisor = get_crop_advisor()
         advisory = advisor.advise(fastest, soil)
         print(f"Fertilizer (basal): {advisory.fertilizer_plan.get('basal', 'see plan')}")
         print(f"Irrigation (vegetative): "
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+import gzip
+import hashlib
+import json
+from typing import NamedTuple
+
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
-from .core import CropAdvisor, CropDatabase, SoilAnalyzer
+from .core import SoilAnalyzer, get_crop_advisor, get_crop_database
+from .middleware import PostBodyLRUMiddleware
 from .models import AGRICULTURAL_DISCLAIMER, CropAdvisory, SoilProfile, WeatherData
 
 app = FastAPI(
@@ -14,9 +21,87 @@ app = FastAPI(
     version="0.1.0",
 )
 
-_crop_db = CropDatabase()
+_GZIP_MIN_SIZE = 1024
+_GZIP_LEVEL = 5
+
+# Dashboards and mobile retries resend identical soil profiles; replay the
+# stored response for a byte-identical body. Registered before GZip so it sits
+# inside it and caches uncompressed bodies, which GZip then encodes per client.
+app.add_middleware(
+    PostBodyLRUMiddleware,
+    paths=("/api/soil-analysis", "/api/crop-advisory"),
+    maxsize=1024,
+)
+
+# Crop and advisory JSON is repetitive and compresses well. Responses that
+# already carry a Content-Encoding (the pre-compressed /api/crops bodies) are
+# passed through untouched by the middleware.
+app.add_middleware(
+    GZipMiddleware, minimum_size=_GZIP_MIN_SIZE, compresslevel=_GZIP_LEVEL
+)
+
+_crop_db = get_crop_database()
 _soil_analyzer = SoilAnalyzer(_crop_db)
-_crop_advisor = CropAdvisor()
+_crop_advisor = get_crop_advisor()
+
+# The catalogue is static for the lifetime of the process, so serialise it once
+# at import and serve the cached dicts from /api/crops.
+_ALL_CROPS_DUMPED: list[dict[str, object]] = [
+    c.model_dump() for c in _crop_db.all_crops()
+]
+_BY_SEASON_DUMPED: dict[str, list[dict[str, object]]] = {}
+for _dumped in _ALL_CROPS_DUMPED:
+    _BY_SEASON_DUMPED.setdefault(str(_dumped["season"]), []).append(_dumped)
+
+
+class _CachedPayload(NamedTuple):
+    """Pre-encoded JSON body for a /api/crops response and its entity tag.
+
+    ``gzipped``/``gzip_etag`` hold the pre-compressed representation, or are
+    ``None`` when the body is below the compression threshold.
+    """
+
+    body: bytes
+    etag: str
+    gzipped: bytes | None
+    gzip_etag: str | None
+
+
+def _encode_crops(crops: list[dict[str, object]]) -> _CachedPayload:
+    """Encode a crop listing once and derive a strong ETag from the bytes."""
+    body = json.dumps(
+        {"crops": crops, "total": len(crops), "disclaimer": AGRICULTURAL_DISCLAIMER},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if len(body) < _GZIP_MIN_SIZE:
+        return _CachedPayload(body, f'"{digest}"', None, None)
+    gzipped = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+    return _CachedPayload(body, f'"{digest}"', gzipped, f'"{digest}-gzip"')
+
+
+_CROPS_ALL = _encode_crops(_ALL_CROPS_DUMPED)
+_CROPS_BY_SEASON: dict[str, _CachedPayload] = {
+    season: _encode_crops(dumped) for season, dumped in _BY_SEASON_DUMPED.items()
+}
+_CROPS_EMPTY = _encode_crops([])
+_CROPS_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Return True if ``Accept-Encoding`` allows gzip.
+
+    Mirrors the check GZipMiddleware itself applies, so the pre-compressed
+    bodies and middleware-compressed responses are negotiated identically.
+    """
+    return accept_encoding is not None and "gzip" in accept_encoding.lower()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches ``etag``."""
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag in ("*", etag) for tag in candidates)
 
 
 class SoilAnalysisRequest(BaseModel):
@@ -53,26 +138,55 @@ def soil_analysis(request: SoilAnalysisRequest) -> SoilAnalysisResponse:
 
 
 @app.post("/api/crop-advisory", response_model=CropAdvisory)
-def crop_advisory(request: CropAdvisoryRequest) -> CropAdvisory:
-    """Generate a full crop advisory for the specified crop and soil."""
+def crop_advisory(request: CropAdvisoryRequest) -> Response:
+    """Generate a full crop advisory for the specified crop and soil.
+
+    The advisory is built from already-validated models, so it is encoded
+    straight to JSON by pydantic-core and returned as a raw ``Response``;
+    FastAPI's outbound ``response_model`` validation is skipped on purpose
+    (``response_model`` is kept only for the OpenAPI schema).
+    """
     crop = _crop_db.by_name(request.crop_name)
     if crop is None:
         raise HTTPException(
             status_code=404,
             detail=f"Crop '{request.crop_name}' not found in database.",
         )
-    return _crop_advisor.advise(crop, request.soil, request.weather)
+    advisory = _crop_advisor.advise(crop, request.soil, request.weather)
+    return Response(
+        content=advisory.model_dump_json(exclude_unset=True),
+        media_type="application/json",
+    )
 
 
 @app.get("/api/crops")
-def list_crops(season: str | None = None) -> dict[str, object]:
-    """List all crops in the database, optionally filtered by season."""
+def list_crops(
+    season: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Response:
+    """List all crops in the database, optionally filtered by season.
+
+    The JSON body is encoded (and gzip-compressed) once at import and served
+    as raw bytes with an ETag; a matching ``If-None-Match`` header yields
+    ``304 Not Modified``.
+    """
     if season:
-        crops = _crop_db.by_season(season)
+        payload = _CROPS_BY_SEASON.get(season.lower().strip(), _CROPS_EMPTY)
+    else:
+        payload = _CROPS_ALL
+    headers = {"Cache-Control": _CROPS_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if (
+        payload.gzipped is not None
+        and payload.gzip_etag is not None
+        and _accepts_gzip(accept_encoding)
+    ):
+        body, etag = payload.gzipped, payload.gzip_etag
+        headers["Content-Encoding"] = "gzip"
     else:
-        crops = _crop_db.all_crops()
-    return {
-        "crops": [c.model_dump() for c in crops],
-        "total": len(crops),
-        "disclaimer": AGRICULTURAL_DISCLAIMER,
-    }
+        body, etag = payload.body, payload.etag
+    headers["ETag"] = etag
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -2,105 +2,65 @@
 
 from __future__ import annotations
 
-import json
-import sys
+import importlib
 
 import click
 
-from .core import CropAdvisor, CropDatabase, SoilAnalyzer
-from .models import AGRICULTURAL_DISCLAIMER, SoilProfile, WeatherData
-
-
-@click.group()
+# Subcommands live in ``cli_cmds`` and are imported only when looked up, so
+# running `serve` never imports the engine (or pydantic), and the crop
+# catalogue is built only when a command first asks for it. The short help
+# shown by ``--help`` is kept here so listing commands imports nothing; it
+# must match the first line of each command's docstring.
+_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "advise": (
+        "aumai_farmbrain.cli_cmds.advise",
+        "Generate a crop advisory for a given crop and soil profile.",
+    ),
+    "crops": (
+        "aumai_farmbrain.cli_cmds.crops",
+        "List available crops in the database.",
+    ),
+    "serve": (
+        "aumai_farmbrain.cli_cmds.serve",
+        "Start the FarmBrain API server.",
+    ),
+}
+
+
+class _LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is looked up."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *_SUBCOMMANDS})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in _SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(_SUBCOMMANDS[cmd_name][0])
+            self.add_command(module.command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List subcommands from the static help table instead of importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in _SUBCOMMANDS:
+                rows.append((name, _SUBCOMMANDS[name][1]))
+            else:
+                cmd = self.commands[name]
+                if not cmd.hidden:
+                    rows.append((name, cmd.get_short_help_str(formatter.width)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=_LazyGroup)
 @click.version_option()
 def main() -> None:
     """AumAI FarmBrain — Crop advisory and soil analysis for Indian agriculture."""
 
 
-@main.command("advise")
-@click.option("--crop", required=True, help="Crop name (e.g. rice, wheat)")
-@click.option(
-    "--soil",
-    "soil_file",
-    required=True,
-    type=click.Path(exists=True),
-    help="Path to JSON file with SoilProfile data",
-)
-@click.option("--weather", "weather_file", type=click.Path(exists=True), default=None, help="Optional path to JSON file with WeatherData")
-def advise(crop: str, soil_file: str, weather_file: str | None) -> None:
-    """Generate a crop advisory for a given crop and soil profile."""
-    db = CropDatabase()
-    advisor = CropAdvisor()
-
-    crop_obj = db.by_name(crop)
-    if crop_obj is None:
-        click.echo(f"Error: Crop '{crop}' not found. Use 'crops --list' to see available crops.", err=True)
-        sys.exit(1)
-
-    with open(soil_file) as fh:
-        soil = SoilProfile.model_validate(json.load(fh))
-
-    weather: WeatherData | None = None
-    if weather_file:
-        with open(weather_file) as fh:
-            weather = WeatherData.model_validate(json.load(fh))
-
-    advisory = advisor.advise(crop_obj, soil, weather)
-
-    click.echo(f"\n{'='*60}")
-    click.echo(f"CROP ADVISORY: {advisory.crop.name.upper()}")
-    click.echo(f"{'='*60}")
-    click.echo("\nRECOMMENDATIONS:")
-    for rec in advisory.recommendations:
-        click.echo(f"  - {rec}")
-
-    click.echo("\nFERTILIZER PLAN:")
-    for stage, instruction in advisory.fertilizer_plan.items():
-        click.echo(f"  [{stage.upper()}] {instruction}")
-
-    click.echo("\nIRRIGATION SCHEDULE:")
-    for stage, instruction in advisory.irrigation_schedule.items():
-        click.echo(f"  [{stage.upper()}] {instruction}")
-
-    if advisory.risk_alerts:
-        click.echo("\nRISK ALERTS:")
-        for alert in advisory.risk_alerts:
-            click.echo(f"  WARNING: {alert}")
-
-    click.echo(f"\nDISCLAIMER: {AGRICULTURAL_DISCLAIMER}\n")
-
-
-@main.command("crops")
-@click.option("--list", "show_list", is_flag=True, default=False, help="List all available crops")
-@click.option("--season", default=None, help="Filter by season: kharif, rabi, zaid")
-def crops(show_list: bool, season: str | None) -> None:
-    """List available crops in the database."""
-    db = CropDatabase()
-    if season:
-        crop_list = db.by_season(season)
-    else:
-        crop_list = db.all_crops()
-
-    click.echo(f"\nAVAILABLE CROPS ({len(crop_list)} total):")
-    click.echo(f"{'Name':<30} {'Season':<10} {'Water':<10} {'Days':>6}")
-    click.echo("-" * 60)
-    for c in crop_list:
-        click.echo(f"{c.name:<30} {c.season:<10} {c.water_requirement:<10} {c.growth_days:>6}")
-    click.echo(f"\n{AGRICULTURAL_DISCLAIMER}\n")
-
-
-@main.command("serve")
-@click.option("--port", default=8000, help="Port to serve on")
-@click.option("--host", default="127.0.0.1", help="Host to bind to")
-def serve(port: int, host: str) -> None:
-    """Start the FarmBrain API server."""
-    try:
-        import uvicorn
-    except ImportError:
-        click.echo("Error: uvicorn is required to run the server. Install with: pip install uvicorn", err=True)
-        sys.exit(1)
-    uvicorn.run("aumai_farmbrain.api:app", host=host, port=port, reload=False)
-
-
 if __name__ == "__main__":
     main()
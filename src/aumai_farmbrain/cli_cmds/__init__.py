@@ -0,0 +1 @@
+"""Subcommand modules for the aumai-farmbrain CLI, loaded on demand by ``cli.main``."""
@@ -0,0 +1,96 @@
+"""``advise`` subcommand: print a full crop advisory."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json as _json  # type: ignore[no-redef]
+
+from ..core import get_crop_advisor, get_crop_database
+from ..models import AGRICULTURAL_DISCLAIMER, SoilProfile, WeatherData
+
+
+@click.command("advise")
+@click.option("--crop", required=True, help="Crop name (e.g. rice, wheat)")
+@click.option(
+    "--soil",
+    "soil_file",
+    required=True,
+    type=click.Path(exists=True),
+    help="Path to JSON file with SoilProfile data",
+)
+@click.option(
+    "--weather",
+    "weather_file",
+    type=click.Path(exists=True),
+    default=None,
+    help="Optional path to JSON file with WeatherData",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the advisory as JSON instead of a report",
+)
+def advise(crop: str, soil_file: str, weather_file: str | None, as_json: bool) -> None:
+    """Generate a crop advisory for a given crop and soil profile."""
+    db = get_crop_database()
+    advisor = get_crop_advisor()
+
+    crop_obj = db.by_name(crop)
+    if crop_obj is None:
+        click.echo(
+            f"Error: Crop '{crop}' not found. Use 'crops --list' to see available crops.",
+            err=True,
+        )
+        sys.exit(1)
+
+    with open(soil_file, "rb") as fh:
+        soil = SoilProfile.model_validate(_json.loads(fh.read()))
+
+    weather: WeatherData | None = None
+    if weather_file:
+        with open(weather_file, "rb") as fh:
+            weather = WeatherData.model_validate(_json.loads(fh.read()))
+
+    advisory = advisor.advise(crop_obj, soil, weather)
+
+    if as_json:
+        click.echo(advisory.model_dump_json(indent=2))
+        return
+
+    # Assemble the whole report and write it with a single echo.
+    lines = [
+        f"\n{'=' * 60}",
+        f"CROP ADVISORY: {advisory.crop.name.upper()}",
+        f"{'=' * 60}",
+        "\nRECOMMENDATIONS:",
+    ]
+    lines.extend(f"  - {rec}" for rec in advisory.recommendations)
+
+    lines.append("\nFERTILIZER PLAN:")
+    lines.extend(
+        f"  [{stage.upper()}] {instruction}"
+        for stage, instruction in advisory.fertilizer_plan.items()
+    )
+
+    lines.append("\nIRRIGATION SCHEDULE:")
+    lines.extend(
+        f"  [{stage.upper()}] {instruction}"
+        for stage, instruction in advisory.irrigation_schedule.items()
+    )
+
+    if advisory.risk_alerts:
+        lines.append("\nRISK ALERTS:")
+        lines.extend(f"  WARNING: {alert}" for alert in advisory.risk_alerts)
+
+    lines.append(f"\nDISCLAIMER: {AGRICULTURAL_DISCLAIMER}\n")
+    click.echo("\n".join(lines))
+
+
+command = advise
@@ -0,0 +1,37 @@
+"""``crops`` subcommand: list the crop catalogue."""
+
+from __future__ import annotations
+
+import click
+
+from ..core import get_crop_database
+from ..models import AGRICULTURAL_DISCLAIMER
+
+
+@click.command("crops")
+@click.option(
+    "--list", "show_list", is_flag=True, default=False, help="List all available crops"
+)
+@click.option("--season", default=None, help="Filter by season: kharif, rabi, zaid")
+def crops(show_list: bool, season: str | None) -> None:
+    """List available crops in the database."""
+    db = get_crop_database()
+    if season:
+        crop_list = db.by_season(season)
+    else:
+        crop_list = db.all_crops()
+
+    lines = [
+        f"\nAVAILABLE CROPS ({len(crop_list)} total):",
+        f"{'Name':<30} {'Season':<10} {'Water':<10} {'Days':>6}",
+        "-" * 60,
+    ]
+    lines.extend(
+        f"{c.name:<30} {c.season:<10} {c.water_requirement:<10} {c.growth_days:>6}"
+        for c in crop_list
+    )
+    lines.append(f"\n{AGRICULTURAL_DISCLAIMER}\n")
+    click.echo("\n".join(lines))
+
+
+command = crops
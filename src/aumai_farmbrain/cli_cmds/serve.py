@@ -0,0 +1,65 @@
+"""``serve`` subcommand: run the FastAPI application under uvicorn."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+
+import click
+
+# Every endpoint is synchronous, CPU-bound and reads only process-local
+# singletons, so throughput scales with worker processes.
+_DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+@click.command("serve")
+@click.option("--port", default=8000, help="Port to serve on")
+@click.option("--host", default="127.0.0.1", help="Host to bind to")
+@click.option(
+    "--workers",
+    default=_DEFAULT_WORKERS,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes",
+)
+@click.option(
+    "--loop",
+    default="uvloop",
+    show_default=True,
+    type=click.Choice(["auto", "asyncio", "uvloop"]),
+    help="Event loop; uvloop is optional and falls back to auto when not installed",
+)
+def serve(port: int, host: str, workers: int, loop: str) -> None:
+    """Start the FarmBrain API server.
+
+    Uses the httptools HTTP parser when it is installed. Install uvloop and
+    httptools with: pip install "uvicorn[standard]"
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        click.echo(
+            "Error: uvicorn is required to run the server. Install with: pip install uvicorn",
+            err=True,
+        )
+        sys.exit(1)
+    if loop == "uvloop" and not _available("uvloop"):
+        loop = "auto"
+    http = "httptools" if _available("httptools") else "auto"
+    uvicorn.run(
+        "aumai_farmbrain.api:app",
+        host=host,
+        port=port,
+        reload=False,
+        workers=workers,
+        loop=loop,
+        http=http,
+    )
+
+
+command = serve
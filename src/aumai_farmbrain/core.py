@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import BaseModel
+
 from .models import (
     AGRICULTURAL_DISCLAIMER,
     Crop,
     CropAdvisory,
+    Season,
     SoilProfile,
+    WaterRequirement,
     WeatherData,
 )
 
-__all__ = ["CropDatabase", "SoilAnalyzer", "CropAdvisor"]
+__all__ = [
+    "CropDatabase",
+    "SoilAnalyzer",
+    "CropAdvisor",
+    "get_crop_database",
+    "get_crop_advisor",
+]
 
 # ---------------------------------------------------------------------------
 # Static crop catalogue — 50+ Indian crops
@@ -74,32 +92,183 @@ _RAW_CROPS: list[dict[str, object]] = [
 ]
 
 
+_SOIL_TYPES_POOL: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _normalise_entry(entry: dict[str, object]) -> dict[str, object]:
+    """Lowercase and intern the categorical fields of a raw catalogue entry.
+
+    Values such as ``"loam"`` recur across dozens of crops; interning makes
+    them share one object so equality checks against them hit the identity
+    fast path. Identical ``soil_types`` tuples are likewise pooled, so crops
+    with the same soils share one immutable tuple.
+    """
+    soil_types: list[str] = entry["soil_types"]  # type: ignore[assignment]
+    key = tuple(sys.intern(s.lower().strip()) for s in soil_types)
+    return {
+        **entry,
+        "season": sys.intern(str(entry["season"]).lower().strip()),
+        "water_requirement": sys.intern(
+            str(entry["water_requirement"]).lower().strip()
+        ),
+        "soil_types": _SOIL_TYPES_POOL.setdefault(key, key),
+    }
+
+
+# The catalogue is authored in-repo and normalised above, so the Crop objects
+# are built once at import without re-running field validation; the test
+# suite validates every entry instead.
+_CROPS_CACHED: tuple[Crop, ...] = tuple(
+    Crop.model_construct(**_normalise_entry(entry)) for entry in _RAW_CROPS  # type: ignore[arg-type]
+)
+
+
 class CropDatabase:
     """In-memory catalogue of 50+ Indian crops with lookup utilities."""
 
     def __init__(self) -> None:
-        self._crops: list[Crop] = [Crop(**entry) for entry in _RAW_CROPS]  # type: ignore[arg-type]
+        # Crops are frozen, so instances can share them; each database still
+        # owns its list so subclasses can extend it.
+        self._crops: list[Crop] = list(_CROPS_CACHED)
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """(Re)build the name, season and soil-type lookup indexes.
+
+        Besides the bucket dicts, each season, soil type, water requirement and
+        crop name gets a column bitmask in which bit ``i`` is set when
+        ``self._crops[i]`` has that value, so compound filters reduce to
+        integer ``&`` and ``|``.
+
+        ``_growth_order`` holds the row indices ordered by ``growth_days`` (a
+        stable argsort), so ordered selections walk it instead of sorting.
+
+        Subclasses that modify ``self._crops`` after construction must call
+        this again so lookups see the new entries.
+        """
+        by_season: defaultdict[str, list[Crop]] = defaultdict(list)
+        by_soil: defaultdict[str, list[Crop]] = defaultdict(list)
+        by_soil_water: defaultdict[tuple[str, str], list[Crop]] = defaultdict(list)
+        self._by_name: dict[str, Crop] = {}
+        self._season_bits: defaultdict[str, int] = defaultdict(int)
+        self._soil_bits: defaultdict[str, int] = defaultdict(int)
+        self._water_bits: defaultdict[str, int] = defaultdict(int)
+        self._name_bits: defaultdict[str, int] = defaultdict(int)
+        for i, crop in enumerate(self._crops):
+            bit = 1 << i
+            self._by_name.setdefault(crop.name.lower().strip(), crop)
+            self._name_bits[crop.name] |= bit
+            season = crop.season.lower().strip()
+            by_season[season].append(crop)
+            self._season_bits[season] |= bit
+            water = crop.water_requirement.lower().strip()
+            self._water_bits[water] |= bit
+            for soil_type in dict.fromkeys(s.lower().strip() for s in crop.soil_types):
+                by_soil[soil_type].append(crop)
+                by_soil_water[(soil_type, water)].append(crop)
+                self._soil_bits[soil_type] |= bit
+        self._all_bits = (1 << len(self._crops)) - 1
+        self._crops_tuple: tuple[Crop, ...] = tuple(self._crops)
+        self._name_set: frozenset[str] = frozenset(self._by_name)
+        self._by_season: dict[str, tuple[Crop, ...]] = {
+            key: tuple(bucket) for key, bucket in by_season.items()
+        }
+        self._by_soil: dict[str, tuple[Crop, ...]] = {
+            key: tuple(bucket) for key, bucket in by_soil.items()
+        }
+        growth_days = attrgetter("growth_days")
+        days = [crop.growth_days for crop in self._crops]
+        self._growth_order: tuple[int, ...] = tuple(
+            sorted(range(len(days)), key=days.__getitem__)
+        )
+        self._by_soil_water: dict[tuple[str, str], tuple[Crop, ...]] = {
+            key: tuple(sorted(bucket, key=growth_days))
+            for key, bucket in by_soil_water.items()
+        }
+
+    def all_crops(self) -> Sequence[Crop]:
+        """Return every crop in the database, as a shared read-only tuple."""
+        return self._crops_tuple
 
-    def all_crops(self) -> list[Crop]:
-        """Return every crop in the database."""
+    def mutable_copy(self) -> list[Crop]:
+        """Return every crop in the database as a new list the caller may modify."""
         return list(self._crops)
 
     def by_name(self, name: str) -> Crop | None:
         """Case-insensitive crop lookup by name."""
-        name_lower = name.lower()
-        for crop in self._crops:
-            if crop.name.lower() == name_lower:
-                return crop
-        return None
+        return self._by_name.get(name.lower().strip())
 
-    def by_season(self, season: str) -> list[Crop]:
+    def has_crop(self, name: str) -> bool:
+        """Case-insensitive check that a crop name is in the catalogue."""
+        return name.lower().strip() in self._name_set
+
+    def by_season(self, season: str) -> Sequence[Crop]:
         """Return crops for a given season (kharif/rabi/zaid)."""
-        return [c for c in self._crops if c.season == season.lower()]
+        return self._by_season.get(season.lower().strip(), ())
 
-    def by_soil_type(self, soil_type: str) -> list[Crop]:
+    def by_soil_type(self, soil_type: str) -> Sequence[Crop]:
         """Return crops compatible with a specific soil type."""
-        soil_lower = soil_type.lower()
-        return [c for c in self._crops if any(s.lower() == soil_lower for s in c.soil_types)]
+        return self._by_soil.get(soil_type.lower().strip(), ())
+
+    def select(
+        self,
+        season: str | None = None,
+        soil_type: str | None = None,
+        water_requirement: str | None = None,
+        order_by: str | None = None,
+        water_exempt: Iterable[str] = (),
+    ) -> list[Crop]:
+        """Return crops matching every given criterion.
+
+        Each criterion is case-insensitive; ``None`` leaves that column
+        unfiltered. Crops whose exact name is in ``water_exempt`` pass the
+        ``water_requirement`` filter whatever their water need (they must
+        still match the other criteria). Results are in catalogue order
+        unless ``order_by`` is ``"growth_days"``, which returns the
+        fastest-maturing crops first (ties keep catalogue order); any other
+        ``order_by`` raises ``ValueError``.
+        """
+        if order_by not in (None, "growth_days"):
+            raise ValueError(
+                f"Unsupported order_by {order_by!r}; expected 'growth_days'."
+            )
+        bits = self._all_bits
+        if season is not None:
+            bits &= self._season_bits.get(season.lower().strip(), 0)
+        if soil_type is not None:
+            bits &= self._soil_bits.get(soil_type.lower().strip(), 0)
+        if water_requirement is not None:
+            bits &= self._water_bits.get(
+                water_requirement.lower().strip(), 0
+            ) | self._bits_for_names(water_exempt)
+        if order_by is not None:
+            crops = self._crops
+            return [crops[i] for i in self._growth_order if bits >> i & 1]
+        return self._from_bits(bits)
+
+    def _bits_for_names(self, names: Iterable[str]) -> int:
+        """Return the row bitmask of crops whose name is exactly one of ``names``."""
+        bits = 0
+        for name in names:
+            bits |= self._name_bits.get(name, 0)
+        return bits
+
+    def _from_bits(self, bits: int) -> list[Crop]:
+        """Translate a row bitmask back into the crops it selects."""
+        crops = self._crops
+        selected: list[Crop] = []
+        while bits:
+            low = bits & -bits
+            selected.append(crops[low.bit_length() - 1])
+            bits ^= low
+        return selected
+
+    def by_soil_and_water(
+        self, soil_type: str, water_requirement: str
+    ) -> Sequence[Crop]:
+        """Return crops for a soil type and water need, fastest-maturing first."""
+        key = (soil_type.lower().strip(), water_requirement.lower().strip())
+        return self._by_soil_water.get(key, ())
 
 
 # ---------------------------------------------------------------------------
@@ -116,15 +285,61 @@ _K_LOW = 108.0
 _K_HIGH = 280.0
 _OC_LOW = 0.5
 
+# (field, low, high, low message, high message, adequate message) for the
+# nutrients whose messages do not interpolate the measured value.
+_NUTRIENT_THRESHOLDS: tuple[tuple[str, float, float, str, str, str], ...] = (
+    (
+        "nitrogen_ppm",
+        _N_LOW,
+        _N_HIGH,
+        "Nitrogen is LOW. Apply urea (46% N) at 120-150 kg/ha or"
+        " incorporate green manure crops like dhaincha.",
+        "Nitrogen is HIGH. Reduce nitrogenous fertilizer applications"
+        " and monitor for vegetative imbalance.",
+        "Nitrogen level is adequate.",
+    ),
+    (
+        "phosphorus_ppm",
+        _P_LOW,
+        _P_HIGH,
+        "Phosphorus is LOW. Apply DAP (18-46-0) at 100-125 kg/ha"
+        " or single super phosphate (SSP).",
+        "Phosphorus is HIGH. Skip phosphatic fertilizers this season.",
+        "Phosphorus level is adequate.",
+    ),
+    (
+        "potassium_ppm",
+        _K_LOW,
+        _K_HIGH,
+        "Potassium is LOW. Apply muriate of potash (MOP) at 60-80 kg/ha"
+        " or use potassium sulphate for chloride-sensitive crops.",
+        "Potassium is HIGH. No additional potassic fertilizer required.",
+        "Potassium level is adequate.",
+    ),
+)
+
+
+# pH band edges for crop suitability, and the crops kept on soils below
+# _SUITABLE_PH_MIN regardless of their water need.
+_SUITABLE_PH_MIN = 5.5
+_SUITABLE_PH_MAX = 8.0
+_ACID_TOLERANT: frozenset[str] = frozenset({"Rice", "Jute", "Turmeric", "Ginger"})
+
 
 class SoilAnalyzer:
     """Analyses soil profiles and recommends suitable crops."""
 
     def __init__(self, crop_db: CropDatabase | None = None) -> None:
-        self._db = crop_db or CropDatabase()
+        self._db = crop_db or get_crop_database()
+
+    def analyze(
+        self, soil: SoilProfile, include_disclaimer: bool = True
+    ) -> list[str]:
+        """Return agronomic recommendations for the given soil profile.
 
-    def analyze(self, soil: SoilProfile) -> list[str]:
-        """Return agronomic recommendations for the given soil profile."""
+        The list ends with ``AGRICULTURAL_DISCLAIMER`` unless
+        ``include_disclaimer`` is false.
+        """
         recs: list[str] = []
 
         # pH
@@ -141,41 +356,15 @@ class SoilAnalyzer:
         else:
             recs.append(f"Soil pH {soil.ph:.1f} is within the optimal range (6.0-7.5).")
 
-        # Nitrogen
-        if soil.nitrogen_ppm < _N_LOW:
-            recs.append(
-                "Nitrogen is LOW. Apply urea (46% N) at 120-150 kg/ha or"
-                " incorporate green manure crops like dhaincha."
-            )
-        elif soil.nitrogen_ppm > _N_HIGH:
-            recs.append(
-                "Nitrogen is HIGH. Reduce nitrogenous fertilizer applications"
-                " and monitor for vegetative imbalance."
-            )
-        else:
-            recs.append("Nitrogen level is adequate.")
-
-        # Phosphorus
-        if soil.phosphorus_ppm < _P_LOW:
-            recs.append(
-                "Phosphorus is LOW. Apply DAP (18-46-0) at 100-125 kg/ha"
-                " or single super phosphate (SSP)."
-            )
-        elif soil.phosphorus_ppm > _P_HIGH:
-            recs.append("Phosphorus is HIGH. Skip phosphatic fertilizers this season.")
-        else:
-            recs.append("Phosphorus level is adequate.")
-
-        # Potassium
-        if soil.potassium_ppm < _K_LOW:
-            recs.append(
-                "Potassium is LOW. Apply muriate of potash (MOP) at 60-80 kg/ha"
-                " or use potassium sulphate for chloride-sensitive crops."
-            )
-        elif soil.potassium_ppm > _K_HIGH:
-            recs.append("Potassium is HIGH. No additional potassic fertilizer required.")
-        else:
-            recs.append("Potassium level is adequate.")
+        # Nitrogen, phosphorus, potassium
+        for attr, low, high, low_msg, high_msg, ok_msg in _NUTRIENT_THRESHOLDS:
+            value = getattr(soil, attr)
+            if value < low:
+                recs.append(low_msg)
+            elif value > high:
+                recs.append(high_msg)
+            else:
+                recs.append(ok_msg)
 
         # Organic carbon
         if soil.organic_carbon_pct < _OC_LOW:
@@ -189,81 +378,134 @@ class SoilAnalyzer:
                 f"Organic carbon {soil.organic_carbon_pct:.2f}% is satisfactory."
             )
 
-        recs.append(AGRICULTURAL_DISCLAIMER)
+        if include_disclaimer:
+            recs.append(AGRICULTURAL_DISCLAIMER)
         return recs
 
+    def analyze_many(self, soils: Iterable[SoilProfile]) -> list[list[str]]:
+        """Return :meth:`analyze` results for each profile, in input order.
+
+        Identical profiles within the batch are analysed once; every entry in
+        the result is still its own list.
+        """
+        seen: dict[SoilProfile, list[str]] = {}
+        results: list[list[str]] = []
+        for soil in soils:
+            recs = seen.get(soil)
+            if recs is None:
+                recs = seen[soil] = self.analyze(soil)
+            results.append(list(recs))
+        return results
+
     def suitable_crops(self, soil: SoilProfile) -> list[Crop]:
         """Return crops compatible with the given soil profile based on type and pH."""
-        compatible: list[Crop] = []
-        for crop in self._db.all_crops():
-            soil_match = any(
-                s.lower() == soil.soil_type.lower() for s in crop.soil_types
+        ph = soil.ph
+        if ph < _SUITABLE_PH_MIN:
+            # High-water crops and the acid-tolerant staples cope with acidity.
+            return self._db.select(
+                soil_type=soil.soil_type,
+                water_requirement=WaterRequirement.HIGH,
+                water_exempt=_ACID_TOLERANT,
             )
-            if not soil_match:
-                continue
-            # pH suitability heuristic
-            if soil.ph < 5.5 and crop.water_requirement == "high":
-                # Rice tolerates acidic; keep it
-                compatible.append(crop)
-            elif soil.ph < 5.5 and crop.name in ("Rice", "Jute", "Turmeric", "Ginger"):
-                compatible.append(crop)
-            elif 5.5 <= soil.ph <= 8.0:
-                compatible.append(crop)
-            elif soil.ph > 8.0 and crop.water_requirement == "low":
-                compatible.append(crop)
-        return compatible
+        if ph > _SUITABLE_PH_MAX:
+            return self._db.select(
+                soil_type=soil.soil_type, water_requirement=WaterRequirement.LOW
+            )
+        return self._db.select(soil_type=soil.soil_type)
 
 
 # ---------------------------------------------------------------------------
 # Crop advisor
 # ---------------------------------------------------------------------------
 
+_ModelKey = tuple[tuple[str, Any], ...]
+
+
+def _model_key(model: BaseModel) -> _ModelKey:
+    """Return a hashable fingerprint of a model's field values."""
+    return tuple(
+        (field, tuple(value) if isinstance(value, list) else value)
+        for field, value in model.model_dump().items()
+    )
+
+
+def _detached(advisory: CropAdvisory) -> CropAdvisory:
+    """Copy a cached advisory so the caller owns its lists.
+
+    The plans are read-only views of the class tables and are shared as-is.
+    """
+    return advisory.model_copy(
+        update={
+            "recommendations": list(advisory.recommendations),
+            "risk_alerts": list(advisory.risk_alerts),
+        }
+    )
+
+
+_CropPlans = tuple[Mapping[str, str], Mapping[str, str]]
+
+
+def _fertilizer_key(crop_name: str) -> str:
+    """Normalise a crop name to its fertilizer-plan key ("Pea (Matar)" -> "pea")."""
+    return crop_name.lower().split("(")[0].strip()
+
+
 class CropAdvisor:
     """Generates complete crop advisories including fertilizer and irrigation plans."""
 
-    _FERTILIZER_PLANS: dict[str, dict[str, str]] = {
-        "rice": {
+    _FERTILIZER_PLANS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+        "rice": MappingProxyType({
             "basal": "Apply DAP 50 kg/ha + MOP 25 kg/ha at transplanting.",
             "tillering": "Top-dress urea 30 kg/ha at 21 DAT.",
             "panicle initiation": "Apply urea 30 kg/ha + potassium sulphate 20 kg/ha.",
-        },
-        "wheat": {
+        }),
+        "wheat": MappingProxyType({
             "basal": "Apply DAP 50 kg/ha + MOP 20 kg/ha at sowing.",
             "crown root initiation": "Top-dress urea 60 kg/ha at CRI stage (20-25 DAS).",
             "jointing": "Apply urea 30 kg/ha at jointing stage.",
-        },
-        "cotton": {
+        }),
+        "cotton": MappingProxyType({
             "basal": "Apply SSP 150 kg/ha + MOP 25 kg/ha at sowing.",
             "squaring": "Apply urea 40 kg/ha + boron 1 kg/ha at squaring.",
             "boll development": "Top-dress NPK 12:32:16 at 50 kg/ha.",
-        },
-        "default": {
+        }),
+        "default": MappingProxyType({
             "basal": "Apply recommended NPK complex fertilizer at sowing/planting.",
             "vegetative": "Top-dress nitrogen source at active vegetative growth.",
             "reproductive": "Apply potassium-rich fertilizer at flowering/fruiting.",
-        },
-    }
+        }),
+    })
 
-    _IRRIGATION_SCHEDULES: dict[str, dict[str, str]] = {
-        "high": {
+    _IRRIGATION_SCHEDULES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+        WaterRequirement.HIGH: MappingProxyType({
             "establishment": "Irrigate immediately after sowing/transplanting.",
             "vegetative": "Maintain field capacity; irrigate every 5-7 days.",
             "reproductive": "Critical stage — do not stress; irrigate every 4-5 days.",
             "maturation": "Reduce irrigation; withhold 10-15 days before harvest.",
-        },
-        "medium": {
+        }),
+        WaterRequirement.MEDIUM: MappingProxyType({
             "establishment": "Apply light irrigation at sowing.",
             "vegetative": "Irrigate every 10-12 days or at 50% soil moisture depletion.",
             "reproductive": "Irrigate every 7-10 days at flowering/grain fill.",
             "maturation": "Reduce irrigation 2-3 weeks before harvest.",
-        },
-        "low": {
+        }),
+        WaterRequirement.LOW: MappingProxyType({
             "establishment": "One irrigation at sowing if soil is dry.",
             "vegetative": "Irrigate every 15-20 days or rely on rainfall.",
             "reproductive": "One critical irrigation at flowering if rainfall is inadequate.",
             "maturation": "Withhold irrigation 3 weeks before harvest.",
-        },
-    }
+        }),
+    })
+
+    def __init__(
+        self,
+        soil_analyzer: SoilAnalyzer | None = None,
+        cache_size: int = 4096,
+    ) -> None:
+        self._soil_analyzer = soil_analyzer or SoilAnalyzer(get_crop_database())
+        self._advise_cached = functools.lru_cache(maxsize=cache_size)(
+            self._advise_from_keys
+        )
 
     def advise(
         self,
@@ -271,21 +513,80 @@ class CropAdvisor:
         soil: SoilProfile,
         weather: WeatherData | None = None,
     ) -> CropAdvisory:
-        """Generate a complete CropAdvisory for the given inputs."""
-        recommendations: list[str] = []
-        risk_alerts: list[str] = []
+        """Generate a complete CropAdvisory for the given inputs.
+
+        Advisories are memoised on the field values of ``crop``, ``soil`` and
+        ``weather``. Each call returns its own copy of the cached advisory, so
+        changing one result never affects another.
+        """
+        return _detached(
+            self._advise_cached(
+                _model_key(crop),
+                _model_key(soil),
+                _model_key(weather) if weather is not None else None,
+            )
+        )
 
-        recommendations.append(
-            f"{crop.name} is a {crop.season} crop requiring"
-            f" {crop.water_requirement} water and {crop.growth_days} days to mature."
+    def advise_many(
+        self,
+        crop: Crop,
+        soils: Iterable[SoilProfile],
+        weather: WeatherData | None = None,
+    ) -> list[CropAdvisory]:
+        """Advise on one crop across many soil profiles, in input order.
+
+        The crop and weather fingerprints are computed once for the batch.
+        Results share the :meth:`advise` cache and are likewise copies.
+        """
+        crop_key = _model_key(crop)
+        weather_key = _model_key(weather) if weather is not None else None
+        return [
+            _detached(self._advise_cached(crop_key, _model_key(soil), weather_key))
+            for soil in soils
+        ]
+
+    def _advise_from_keys(
+        self,
+        crop_key: _ModelKey,
+        soil_key: _ModelKey,
+        weather_key: _ModelKey | None,
+    ) -> CropAdvisory:
+        """Rebuild the input models from their cache keys and run the advisor."""
+        return self._build_advisory(
+            Crop.model_construct(**dict(crop_key)),
+            SoilProfile.model_construct(**dict(soil_key)),
+            WeatherData.model_construct(**dict(weather_key))
+            if weather_key is not None
+            else None,
         )
-        recommendations.append(
-            f"Compatible soil types: {', '.join(crop.soil_types)}."
-            f" Current soil type is {soil.soil_type}."
+
+    def _plans_for(self, crop: Crop) -> _CropPlans:
+        """Return the (fertilizer, irrigation) plan tables for ``crop``."""
+        return (
+            self._FERTILIZER_PLANS.get(
+                _fertilizer_key(crop.name), self._FERTILIZER_PLANS["default"]
+            ),
+            self._IRRIGATION_SCHEDULES[crop.water_requirement],
         )
 
-        soil_analyzer = SoilAnalyzer()
-        recommendations.extend(soil_analyzer.analyze(soil)[:-1])  # strip trailing disclaimer
+    def _build_advisory(
+        self,
+        crop: Crop,
+        soil: SoilProfile,
+        weather: WeatherData | None,
+    ) -> CropAdvisory:
+        """Uncached advisory generation."""
+        risk_alerts: list[str] = []
+
+        # The advisory carries the disclaimer in its own field.
+        soil_recs = self._soil_analyzer.analyze(soil, include_disclaimer=False)
+        recommendations = [
+            f"{crop.name} is a {crop.season} crop requiring"
+            f" {crop.water_requirement} water and {crop.growth_days} days to mature.",
+            f"Compatible soil types: {', '.join(crop.soil_types)}."
+            f" Current soil type is {soil.soil_type}.",
+            *soil_recs,
+        ]
 
         # Weather-based recommendations
         if weather is not None:
@@ -294,7 +595,7 @@ class CropAdvisor:
                     f"Extreme heat ({weather.temperature_c}°C) at {weather.location}."
                     " Apply mulching and increase irrigation frequency."
                 )
-            if weather.temperature_c < 5 and crop.season == "kharif":
+            if weather.temperature_c < 5 and crop.season == Season.KHARIF:
                 risk_alerts.append(
                     "Unexpectedly cold conditions for a kharif crop."
                     " Protect seedlings with polythene covers."
@@ -322,21 +623,33 @@ class CropAdvisor:
                 " Apply zinc sulphate 25 kg/ha."
             )
 
-        # Fertilizer plan
-        crop_key = crop.name.lower().split("(")[0].strip()
-        fertilizer_plan = self._FERTILIZER_PLANS.get(
-            crop_key, self._FERTILIZER_PLANS["default"]
-        )
-
-        # Irrigation schedule
-        irrigation_schedule = self._IRRIGATION_SCHEDULES[crop.water_requirement]
+        fertilizer_plan, irrigation_schedule = self._plans_for(crop)
 
-        return CropAdvisory(
+        # Every input is already valid, so skip re-validation; the read-only
+        # plan tables go in as views rather than copies.
+        return CropAdvisory.model_construct(
             crop=crop,
             soil=soil,
             recommendations=recommendations,
-            fertilizer_plan=dict(fertilizer_plan),
-            irrigation_schedule=dict(irrigation_schedule),
+            fertilizer_plan=fertilizer_plan,
+            irrigation_schedule=irrigation_schedule,
             risk_alerts=risk_alerts,
             disclaimer=AGRICULTURAL_DISCLAIMER,
         )
+
+
+# ---------------------------------------------------------------------------
+# Shared instances
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def get_crop_database() -> CropDatabase:
+    """Return the process-wide CropDatabase, building it on first call."""
+    return CropDatabase()
+
+
+@functools.cache
+def get_crop_advisor() -> CropAdvisor:
+    """Return the process-wide CropAdvisor, so every caller shares one cache."""
+    return CropAdvisor()
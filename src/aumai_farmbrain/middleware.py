@@ -0,0 +1,111 @@
+"""ASGI middleware for the aumai-farmbrain API."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Collection
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = ["PostBodyLRUMiddleware"]
+
+_CachedResponse = tuple[int, list[tuple[bytes, bytes]], bytes]
+
+
+class PostBodyLRUMiddleware:
+    """Cache successful POST responses keyed on a hash of the request.
+
+    The advisory endpoints are pure functions of their JSON body and the static
+    catalogue, so an identical request always yields an identical response. The
+    key covers the path, query string, ``Content-Type`` header and body. Other
+    headers are left out, so ``Accept-Encoding`` never fragments the cache; an
+    outer GZip middleware compresses replayed responses per request. Only
+    ``200`` responses for the configured ``paths`` are stored; at most
+    ``maxsize`` entries are kept, evicting the least recently used. The cache
+    lives for the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Collection[str],
+        maxsize: int = 1024,
+    ) -> None:
+        self.app = app
+        self._paths = frozenset(paths)
+        self._maxsize = maxsize
+        self._lru: OrderedDict[bytes, _CachedResponse] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self._paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks: list[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                return  # client disconnected before sending the full body
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        content_type = next(
+            (value for name, value in scope["headers"] if name == b"content-type"),
+            b"",
+        )
+        key = hashlib.blake2b(
+            b"\0".join(
+                (scope["path"].encode(), scope["query_string"], content_type, body)
+            ),
+            digest_size=16,
+        ).digest()
+
+        cached = self._lru.get(key)
+        if cached is not None:
+            self._lru.move_to_end(key)
+            cached_status, cached_headers, content = cached
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": cached_status,
+                    # Copy: outer middleware such as GZip edits headers in place.
+                    "headers": list(cached_headers),
+                }
+            )
+            await send({"type": "http.response.body", "body": content})
+            return
+
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status = 0
+        headers: list[tuple[bytes, bytes]] = []
+        parts: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                parts.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, replay, capture)
+
+        if status == 200:
+            self._lru[key] = (status, headers, b"".join(parts))
+            if len(self._lru) > self._maxsize:
+                self._lru.popitem(last=False)
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator
+import sys
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Annotated
 
-AGRICULTURAL_DISCLAIMER = (
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, field_validator
+
+AGRICULTURAL_DISCLAIMER = sys.intern(
     "This tool provides AI-assisted agricultural analysis only. Verify all recommendations"
     " with local agricultural experts and government extension services before application."
     " Crop yields and soil recommendations are estimates based on limited data."
 )
 
 __all__ = [
+    "Season",
+    "WaterRequirement",
     "Crop",
     "SoilProfile",
     "WeatherData",
@@ -18,20 +25,47 @@ __all__ = [
     "AGRICULTURAL_DISCLAIMER",
 ]
 
+# All models are immutable value objects. Inputs are validated once on
+# construction (or at the API boundary); nothing is re-validated afterwards.
+_MODEL_CONFIG = ConfigDict(frozen=True)
+
+
+class Season(StrEnum):
+    """Indian cropping seasons. Members compare and hash equal to their values."""
+
+    KHARIF = "kharif"
+    RABI = "rabi"
+    ZAID = "zaid"
+
+
+class WaterRequirement(StrEnum):
+    """Water-requirement classes. Members compare and hash equal to their values."""
+
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+_SEASONS: frozenset[str] = frozenset(Season)
+
+# Stage-keyed plans. The advisor stores its shared read-only plan tables here
+# directly; they serialise as plain JSON objects.
+_StagePlan = Annotated[
+    Mapping[str, str], PlainSerializer(dict, return_type=dict[str, str])
+]
+
 
 class Crop(BaseModel):
     """Represents an Indian agricultural crop with cultivation metadata."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Common name of the crop")
-    season: str = Field(
-        ...,
-        description="Growing season: kharif, rabi, or zaid",
-        pattern="^(kharif|rabi|zaid)$",
-    )
+    season: str = Field(..., description="Growing season: kharif, rabi, or zaid")
     water_requirement: str = Field(
         ..., description="Water requirement descriptor (low/medium/high)"
     )
-    soil_types: list[str] = Field(
+    soil_types: tuple[str, ...] = Field(
         ..., description="Compatible soil types for this crop"
     )
     growth_days: int = Field(
@@ -41,13 +75,18 @@ class Crop(BaseModel):
     @field_validator("season")
     @classmethod
     def validate_season(cls, value: str) -> str:
-        """Normalise season to lowercase."""
-        return value.lower()
+        """Normalise season to lowercase (interned) and check it is a known season."""
+        value = value.lower()
+        if value not in _SEASONS:
+            raise ValueError(f"season must be one of kharif, rabi, zaid; got {value!r}")
+        return sys.intern(value)
 
 
 class SoilProfile(BaseModel):
     """Chemical and physical profile of a soil sample."""
 
+    model_config = _MODEL_CONFIG
+
     ph: float = Field(..., ge=0.0, le=14.0, description="Soil pH (0-14)")
     nitrogen_ppm: float = Field(
         ..., ge=0.0, description="Available nitrogen in ppm"
@@ -69,6 +108,8 @@ class SoilProfile(BaseModel):
 class WeatherData(BaseModel):
     """Current weather conditions for an agricultural location."""
 
+    model_config = _MODEL_CONFIG
+
     location: str = Field(..., description="Location name or coordinates string")
     temperature_c: float = Field(..., description="Current temperature in Celsius")
     humidity_pct: float = Field(
@@ -85,15 +126,17 @@ class WeatherData(BaseModel):
 class CropAdvisory(BaseModel):
     """Full advisory output for a crop-soil-weather combination."""
 
+    model_config = _MODEL_CONFIG
+
     crop: Crop
     soil: SoilProfile
     recommendations: list[str] = Field(
         ..., description="Actionable agronomic recommendations"
     )
-    fertilizer_plan: dict[str, str] = Field(
+    fertilizer_plan: _StagePlan = Field(
         ..., description="Fertilizer application schedule keyed by stage"
     )
-    irrigation_schedule: dict[str, str] = Field(
+    irrigation_schedule: _StagePlan = Field(
         ..., description="Irrigation schedule keyed by growth stage"
     )
     risk_alerts: list[str] = Field(
@@ -1 +1,30 @@
 """Shared test fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from aumai_farmbrain.core import (
+    CropAdvisor,
+    CropDatabase,
+    SoilAnalyzer,
+    get_crop_database,
+)
+
+# Session-scoped: tests only read these (the catalogue and models are immutable),
+# so one instance of each serves every test module.
+
+
+@pytest.fixture(scope="session")
+def db() -> CropDatabase:
+    return get_crop_database()
+
+
+@pytest.fixture(scope="session")
+def analyzer(db: CropDatabase) -> SoilAnalyzer:
+    return SoilAnalyzer(crop_db=db)
+
+
+@pytest.fixture(scope="session")
+def advisor() -> CropAdvisor:
+    return CropAdvisor()
@@ -0,0 +1,168 @@
+"""Tests for the FastAPI application."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from aumai_farmbrain import api
+from aumai_farmbrain.api import app
+from aumai_farmbrain.core import get_crop_database
+from aumai_farmbrain.middleware import PostBodyLRUMiddleware
+from aumai_farmbrain.models import SoilProfile
+
+client = TestClient(app)
+
+
+def test_list_crops_returns_full_catalogue() -> None:
+    response = client.get("/api/crops")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == len(get_crop_database().all_crops())
+    assert len(body["crops"]) == body["total"]
+
+
+def test_list_crops_filters_by_season_case_insensitively() -> None:
+    body = client.get("/api/crops", params={"season": "RABI"}).json()
+    assert body["total"] == len(get_crop_database().by_season("rabi"))
+    assert all(c["season"] == "rabi" for c in body["crops"])
+
+
+def test_list_crops_unknown_season_is_empty() -> None:
+    body = client.get("/api/crops", params={"season": "winter"}).json()
+    assert body["crops"] == []
+    assert body["total"] == 0
+
+
+def test_list_crops_sets_etag_and_cache_headers() -> None:
+    response = client.get("/api/crops")
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"].startswith('"')
+    assert "max-age" in response.headers["cache-control"]
+
+
+def test_list_crops_etag_differs_per_season() -> None:
+    kharif = client.get("/api/crops", params={"season": "kharif"})
+    zaid = client.get("/api/crops", params={"season": "zaid"})
+    assert kharif.headers["etag"] != zaid.headers["etag"]
+
+
+def test_list_crops_if_none_match_returns_304() -> None:
+    etag = client.get("/api/crops").headers["etag"]
+    response = client.get("/api/crops", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_list_crops_stale_etag_returns_body() -> None:
+    response = client.get("/api/crops", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["total"] > 0
+
+
+_SOIL = {
+    "ph": 6.8,
+    "nitrogen_ppm": 200.0,
+    "phosphorus_ppm": 18.0,
+    "potassium_ppm": 180.0,
+    "organic_carbon_pct": 0.75,
+    "soil_type": "loam",
+}
+
+
+def test_crop_advisory_returns_full_advisory() -> None:
+    response = client.post("/api/crop-advisory", json={"crop_name": "rice", "soil": _SOIL})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["crop"]["name"] == "Rice"
+    assert "tillering" in body["fertilizer_plan"]
+    assert body["risk_alerts"] == []
+    assert body["disclaimer"]
+
+
+def test_crop_advisory_unknown_crop_returns_404() -> None:
+    response = client.post("/api/crop-advisory", json={"crop_name": "avocado", "soil": _SOIL})
+    assert response.status_code == 404
+
+
+def test_list_crops_serves_precompressed_gzip() -> None:
+    response = client.get("/api/crops", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.json()["total"] > 0
+
+
+def test_list_crops_identity_when_gzip_not_accepted() -> None:
+    response = client.get("/api/crops", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.json()["total"] > 0
+
+
+def test_crop_advisory_is_gzip_compressed_by_middleware() -> None:
+    response = client.post(
+        "/api/crop-advisory",
+        json={"crop_name": "rice", "soil": _SOIL},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_crop_advisory_keeps_openapi_schema() -> None:
+    schema = app.openapi()["paths"]["/api/crop-advisory"]["post"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["$ref"].endswith("/CropAdvisory")
+
+
+def _post_cache() -> PostBodyLRUMiddleware:
+    if app.middleware_stack is None:  # built lazily on the first request
+        app.middleware_stack = app.build_middleware_stack()
+    stack = app.middleware_stack
+    while not isinstance(stack, PostBodyLRUMiddleware):
+        stack = stack.app
+    return stack
+
+
+def test_soil_analysis_repeated_body_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[SoilProfile] = []
+    analyze = api._soil_analyzer.analyze
+
+    def spy(soil: SoilProfile, include_disclaimer: bool = True) -> list[str]:
+        calls.append(soil)
+        return analyze(soil, include_disclaimer)
+
+    monkeypatch.setattr(api._soil_analyzer, "analyze", spy)
+    body = {"soil": {**_SOIL, "ph": 6.25}}  # not posted by any other test
+    before = len(_post_cache()._lru)
+    first = client.post("/api/soil-analysis", json=body)
+    assert len(_post_cache()._lru) == before + 1
+    second = client.post("/api/soil-analysis", json=body)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert len(calls) == 1  # the second response was replayed, not recomputed
+
+
+def test_query_string_is_part_of_the_cache_key() -> None:
+    body = {"soil": {**_SOIL, "ph": 6.35}}
+    client.post("/api/soil-analysis", json=body)
+    before = len(_post_cache()._lru)
+    client.post("/api/soil-analysis", json=body, params={"lang": "hi"})
+    assert len(_post_cache()._lru) == before + 1
+
+
+def test_distinct_bodies_are_cached_separately() -> None:
+    client.post("/api/crop-advisory", json={"crop_name": "rice", "soil": _SOIL})
+    before = len(_post_cache()._lru)
+    response = client.post("/api/crop-advisory", json={"crop_name": "wheat", "soil": _SOIL})
+    assert response.json()["crop"]["name"] == "Wheat"
+    assert len(_post_cache()._lru) == before + 1
+
+
+def test_error_responses_are_not_cached() -> None:
+    client.get("/api/crops")  # ensure the middleware stack is built
+    before = len(_post_cache()._lru)
+    for _ in range(2):
+        response = client.post("/api/crop-advisory", json={"crop_name": "durian", "soil": _SOIL})
+        assert response.status_code == 404
+    assert len(_post_cache()._lru) == before
@@ -1,8 +1,25 @@
 """Tests for CLI."""
 
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import click
+import pytest
 from click.testing import CliRunner
 
-from aumai_farmbrain.cli import main
+from aumai_farmbrain.cli import _SUBCOMMANDS, main
+
+_SOIL = {
+    "ph": 6.8,
+    "nitrogen_ppm": 200.0,
+    "phosphorus_ppm": 18.0,
+    "potassium_ppm": 180.0,
+    "organic_carbon_pct": 0.75,
+    "soil_type": "loam",
+}
 
 
 def test_cli_version() -> None:
@@ -11,3 +28,121 @@ def test_cli_version() -> None:
     result = runner.invoke(main, ["--version"])
     assert result.exit_code == 0
     assert "0.1.0" in result.output
+
+
+def test_cli_advise_reads_soil_and_weather_files(tmp_path: Path) -> None:
+    soil_file = tmp_path / "soil.json"
+    soil_file.write_text(json.dumps(_SOIL))
+    weather_file = tmp_path / "weather.json"
+    weather_file.write_text(
+        json.dumps(
+            {
+                "location": "Jaipur",
+                "temperature_c": 45.0,
+                "humidity_pct": 20.0,
+                "rainfall_mm": 0.0,
+            }
+        )
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["advise", "--crop", "wheat", "--soil", str(soil_file), "--weather", str(weather_file)],
+    )
+    assert result.exit_code == 0
+    assert "CROP ADVISORY: WHEAT" in result.output
+    assert "Extreme heat" in result.output
+
+
+def test_cli_advise_json_output(tmp_path: Path) -> None:
+    soil_file = tmp_path / "soil.json"
+    soil_file.write_text(json.dumps(_SOIL))
+    runner = CliRunner()
+    result = runner.invoke(main, ["advise", "--crop", "rice", "--soil", str(soil_file), "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert payload["crop"]["name"] == "Rice"
+    assert "tillering" in payload["fertilizer_plan"]
+    assert "CROP ADVISORY" not in result.output
+
+
+def test_cli_advise_unknown_crop_exits_nonzero(tmp_path: Path) -> None:
+    soil_file = tmp_path / "soil.json"
+    soil_file.write_text(json.dumps(_SOIL))
+    runner = CliRunner()
+    result = runner.invoke(main, ["advise", "--crop", "avocado", "--soil", str(soil_file)])
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+def test_cli_crops_reuses_shared_database() -> None:
+    from aumai_farmbrain.core import get_crop_database
+
+    runner = CliRunner()
+    first = runner.invoke(main, ["crops", "--season", "zaid"])
+    db = get_crop_database()
+    second = runner.invoke(main, ["crops", "--season", "zaid"])
+    assert first.exit_code == second.exit_code == 0
+    assert first.output == second.output
+    assert get_crop_database() is db
+
+
+def test_cli_module_does_not_import_engine_eagerly() -> None:
+    code = (
+        "import sys, aumai_farmbrain.cli; "
+        "print('aumai_farmbrain.core' in sys.modules, 'fastapi' in sys.modules, "
+        "'aumai_farmbrain.cli_cmds.advise' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False False False"
+
+
+def test_cli_help_lists_lazy_subcommands() -> None:
+    runner = CliRunner()
+    result = runner.invoke(main, ["--help"])
+    assert result.exit_code == 0
+    for name in ("advise", "crops", "serve"):
+        assert name in result.output
+
+
+def test_cli_help_does_not_import_subcommands() -> None:
+    code = (
+        "import sys, aumai_farmbrain.cli as cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('aumai_farmbrain.core' in sys.modules, 'fastapi' in sys.modules, "
+        "any(m.startswith('aumai_farmbrain.cli_cmds.') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "advise  Generate a crop advisory" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "False False False"
+
+
+def test_cli_static_short_help_matches_commands() -> None:
+    for name, (_, short_help) in _SUBCOMMANDS.items():
+        command = main.get_command(click.Context(main), name)
+        assert command is not None
+        assert command.get_short_help_str(limit=200) == short_help
+
+
+def test_cli_serve_passes_workers_and_falls_back_to_auto_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[dict[str, object]] = []
+    fake = types.ModuleType("uvicorn")
+    fake.run = lambda app, **kwargs: calls.append({"app": app, **kwargs})  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvicorn", fake)
+    monkeypatch.setattr("aumai_farmbrain.cli_cmds.serve._available", lambda module: False)
+    runner = CliRunner()
+    result = runner.invoke(main, ["serve", "--workers", "3"])
+    assert result.exit_code == 0, result.output
+    assert calls[0]["app"] == "aumai_farmbrain.api:app"
+    assert calls[0]["workers"] == 3
+    assert calls[0]["loop"] == "auto"
+    assert calls[0]["http"] == "auto"